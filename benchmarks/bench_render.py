@@ -0,0 +1,90 @@
+"""
+Benchmark for rendering a large task list to a pipe.
+Compares the legacy print-per-line output with the buffered Renderer.
+
+Usage:
+    python -m benchmarks.bench_render [--count N]
+"""
+import argparse
+import contextlib
+import os
+import threading
+import time
+
+from src.cli.render import FORMATS, Renderer
+from src.models.task import Task
+
+
+def make_tasks(count: int):
+    """Build a list of tasks with a mix of descriptions and statuses."""
+    return [
+        Task(
+            id=f"task-{i:08d}",
+            title=f"Task number {i}",
+            description=f"Description for task {i}" if i % 2 else None,
+            completed=bool(i % 3 == 0)
+        )
+        for i in range(count)
+    ]
+
+
+@contextlib.contextmanager
+def pipe_writer():
+    """Yield a text stream whose output is drained through an OS pipe."""
+    read_fd, write_fd = os.pipe()
+
+    def drain():
+        with os.fdopen(read_fd, "rb") as reader:
+            while reader.read(1 << 16):
+                pass
+
+    thread = threading.Thread(target=drain)
+    thread.start()
+    writer = os.fdopen(write_fd, "w")
+    try:
+        yield writer
+    finally:
+        writer.close()
+        thread.join()
+
+
+def legacy_display(tasks, stream):
+    """The original display_tasks implementation, one print per line."""
+    print("\nAll Tasks:", file=stream)
+    print("-" * 50, file=stream)
+    for task in tasks:
+        status = "X" if task.completed else "O"
+        print(f"[{status}] ID: {task.id}", file=stream)
+        print(f"    Title: {task.title}", file=stream)
+        if task.description:
+            print(f"    Description: {task.description}", file=stream)
+        print(file=stream)
+
+
+def timed(func) -> float:
+    """Run func with a pipe stream and return the elapsed seconds."""
+    with pipe_writer() as stream:
+        start = time.perf_counter()
+        func(stream)
+        stream.flush()
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.count)
+    print(f"Rendering {args.count} tasks to a pipe")
+    print(f"{'legacy print':<18}{timed(lambda s: legacy_display(tasks, s)):.3f}s")
+    for fmt in FORMATS:
+        def render(stream, fmt=fmt):
+            renderer = Renderer(fmt=fmt, stream=stream)
+            renderer.tasks(tasks)
+            renderer.flush()
+        print(f"{'renderer ' + fmt:<18}{timed(render):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,25 +2,23 @@
 Interactive CLI for the Todo application.
 Provides a menu-based interface for managing todo tasks.
 """
+from ..services.memory_profile import format_report, profile_workload
 from ..services.todo_service import TodoService
 from ..models.task import Task
-from typing import Optional
+from .render import FORMATS, Renderer
+from typing import List, Optional
+import argparse
 import sys
 
 
+# Shared renderer; main() reconfigures it from the command line options
+renderer = Renderer()
+
+
 def print_menu():
     """Display the main menu options."""
-    print("\n" + "="*40)
-    print("TODO APPLICATION - Interactive Menu")
-    print("="*40)
-    print("1. Add a new task")
-    print("2. List all tasks")
-    print("3. Update a task")
-    print("4. Mark task as complete")
-    print("5. Mark task as incomplete")
-    print("6. Delete a task")
-    print("7. Exit")
-    print("-"*40)
+    renderer.menu()
+    renderer.flush()
 
 
 def get_user_choice() -> int:
@@ -31,9 +29,11 @@ def get_user_choice() -> int:
             if 1 <= choice <= 7:
                 return choice
             else:
-                print("Please enter a number between 1 and 7.")
+                renderer.line("Please enter a number between 1 and 7.")
+                renderer.flush()
         except ValueError:
-            print("Invalid input. Please enter a number.")
+            renderer.line("Invalid input. Please enter a number.")
+            renderer.flush()
 
 
 def get_task_details() -> tuple[str, Optional[str]]:
@@ -57,30 +57,21 @@ def get_task_id() -> str:
 
 
 def display_tasks(tasks):
-    """Display all tasks with formatting."""
-    if not tasks:
-        print("\nNo tasks found.")
-        return
-    
-    print("\nAll Tasks:")
-    print("-" * 50)
-    for task in tasks:
-        status = "X" if task.completed else "O"
-        print(f"[{status}] ID: {task.id}")
-        print(f"    Title: {task.title}")
-        if task.description:
-            print(f"    Description: {task.description}")
-        print()
+    """Display all tasks in the renderer's output format."""
+    renderer.tasks(tasks)
+    renderer.flush()
 
 
 def print_success(message: str):
     """Print success message in green (if terminal supports it)."""
-    print(f"\033[92m{message}\033[0m")  # Green text
+    renderer.success(message)
+    renderer.flush()
 
 
 def print_error(message: str):
     """Print error message in red (if terminal supports it)."""
-    print(f"\033[91m{message}\033[0m")  # Red text
+    renderer.error(message)
+    renderer.flush()
 
 
 def handle_add_task(service: TodoService):
@@ -88,12 +79,14 @@ def handle_add_task(service: TodoService):
     try:
         title, description = get_task_details()
         task = service.add_task(title, description)
-        print_success(f"Task '{task.title}' added successfully!")
-        print(f"Task ID: {task.id}")
+        renderer.success(f"Task '{task.title}' added successfully!")
+        renderer.line(f"Task ID: {task.id}")
     except ValueError as e:
-        print_error(f"Error: {e}")
+        renderer.error(f"Error: {e}")
     except Exception as e:
-        print_error(f"Unexpected error: {e}")
+        renderer.error(f"Unexpected error: {e}")
+    finally:
+        renderer.flush()
 
 
 def handle_list_tasks(service: TodoService):
@@ -111,12 +104,14 @@ def handle_update_task(service: TodoService):
         task_id = get_task_id()
         task = service.get_task_by_id(task_id)
         if not task:
-            print_error(f"Task with ID {task_id} not found.")
+            renderer.error(f"Task with ID {task_id} not found.")
             return
         
-        print(f"Current task: {task.title}")
+        renderer.line(f"Current task: {task.title}")
         if task.description:
-            print(f"Current description: {task.description}")
+            renderer.line(f"Current description: {task.description}")
+        # Show the current values before prompting for new ones
+        renderer.flush()
         
         title_input = input("Enter new title (or press Enter to keep current): ").strip()
         description_input = input("Enter new description (or press Enter to keep current): ").strip()
@@ -127,19 +122,21 @@ def handle_update_task(service: TodoService):
         
         # If no changes were made, just return
         if new_title == task.title and new_description == task.description:
-            print("No changes made to the task.")
+            renderer.line("No changes made to the task.")
             return
             
         updated_task = service.update_task(task_id, new_title, new_description)
         if updated_task:
-            print_success("Task updated successfully!")
-            print(f"New title: {updated_task.title}")
+            renderer.success("Task updated successfully!")
+            renderer.line(f"New title: {updated_task.title}")
             if updated_task.description:
-                print(f"New description: {updated_task.description}")
+                renderer.line(f"New description: {updated_task.description}")
     except ValueError as e:
-        print_error(f"Error: {e}")
+        renderer.error(f"Error: {e}")
     except Exception as e:
-        print_error(f"Unexpected error: {e}")
+        renderer.error(f"Unexpected error: {e}")
+    finally:
+        renderer.flush()
 
 
 def handle_complete_task(service: TodoService):
@@ -148,14 +145,16 @@ def handle_complete_task(service: TodoService):
         task_id = get_task_id()
         success = service.mark_task_complete(task_id)
         if success:
-            print_success("Task marked as complete!")
+            renderer.success("Task marked as complete!")
             task = service.get_task_by_id(task_id)
             if task:
-                print(f"Task: {task.title}")
+                renderer.line(f"Task: {task.title}")
         else:
-            print_error(f"Task with ID {task_id} not found.")
+            renderer.error(f"Task with ID {task_id} not found.")
     except Exception as e:
-        print_error(f"Error marking task as complete: {e}")
+        renderer.error(f"Error marking task as complete: {e}")
+    finally:
+        renderer.flush()
 
 
 def handle_incomplete_task(service: TodoService):
@@ -164,14 +163,16 @@ def handle_incomplete_task(service: TodoService):
         task_id = get_task_id()
         success = service.mark_task_incomplete(task_id)
         if success:
-            print_success("Task marked as incomplete!")
+            renderer.success("Task marked as incomplete!")
             task = service.get_task_by_id(task_id)
             if task:
-                print(f"Task: {task.title}")
+                renderer.line(f"Task: {task.title}")
         else:
-            print_error(f"Task with ID {task_id} not found.")
+            renderer.error(f"Task with ID {task_id} not found.")
     except Exception as e:
-        print_error(f"Error marking task as incomplete: {e}")
+        renderer.error(f"Error marking task as incomplete: {e}")
+    finally:
+        renderer.flush()
 
 
 def handle_delete_task(service: TodoService):
@@ -180,16 +181,67 @@ def handle_delete_task(service: TodoService):
         task_id = get_task_id()
         success = service.delete_task(task_id)
         if success:
-            print_success("Task deleted successfully!")
+            renderer.success("Task deleted successfully!")
         else:
-            print_error(f"Task with ID {task_id} not found.")
+            renderer.error(f"Task with ID {task_id} not found.")
     except Exception as e:
-        print_error(f"Error deleting task: {e}")
+        renderer.error(f"Error deleting task: {e}")
+    finally:
+        renderer.flush()
+
+
+def positive_int(value: str) -> int:
+    """Argparse type accepting integers greater than zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
 
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options for the interactive CLI."""
+    parser = argparse.ArgumentParser(description="Interactive Todo Application")
+    parser.add_argument(
+        "--format", choices=FORMATS, default="table",
+        help="Output format for task lists (default: table)"
+    )
+    parser.add_argument(
+        "--no-color", action="store_true",
+        help="Disable colored output even on a terminal"
+    )
+    parser.add_argument(
+        "--profile-memory", action="store_true",
+        help="Run a scripted workload under tracemalloc, print a memory report and exit"
+    )
+    parser.add_argument(
+        "--profile-tasks", type=positive_int, default=10_000, metavar="N",
+        help="Number of tasks added by the memory profiling workload (default: 10000)"
+    )
+    return parser.parse_args(argv)
+
+
+def run_memory_profile(tasks: int):
+    """Print a memory profile of a scripted TodoService workload."""
+    for line in format_report(profile_workload(tasks)):
+        renderer.line(line)
+    renderer.flush()
+
+
+def main(argv: Optional[List[str]] = None):
     """Main entry point for the interactive CLI."""
-    print("Welcome to the Interactive Todo Application!")
+    global renderer
+    args = parse_args(argv)
+    renderer = Renderer(fmt=args.format, color=False if args.no_color else None)
+
+    if args.profile_memory:
+        run_memory_profile(args.profile_tasks)
+        return
+
+    # Written together with the first menu screen
+    renderer.line("Welcome to the Interactive Todo Application!")
     
     service = TodoService()
     
@@ -210,7 +262,8 @@ def main():
         elif choice == 6:
             handle_delete_task(service)
         elif choice == 7:
-            print("\nThank you for using the Todo Application. Goodbye!")
+            renderer.line("\nThank you for using the Todo Application. Goodbye!")
+            renderer.flush()
             sys.exit(0)
         
         # Pause to let user see the result before showing menu again
@@ -0,0 +1,176 @@
+"""
+Rendering layer for the Todo CLI.
+Builds each screen into a single buffer and writes it to the output stream in
+one call, dropping ANSI color codes when the stream is not a terminal.
+"""
+import json
+import sys
+from typing import Iterable, List, Optional, TextIO
+
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+
+FORMATS = ("table", "compact", "json")
+
+
+def stream_supports_color(stream: TextIO) -> bool:
+    """
+    Check whether a stream is attached to a terminal.
+
+    Args:
+        stream (TextIO): The stream to inspect
+
+    Returns:
+        bool: True if the stream is a TTY, False otherwise
+    """
+    isatty = getattr(stream, "isatty", None)
+    if isatty is None:
+        return False
+    try:
+        return bool(isatty())
+    except (ValueError, OSError):
+        return False
+
+
+class Renderer:
+    """
+    Collects output lines into a buffer and flushes them with a single write.
+
+    Attributes:
+        fmt (str): Output format for task lists ("table", "compact" or "json")
+        color (bool, optional): Force colors on or off; None detects from the stream
+    """
+
+    def __init__(
+        self,
+        fmt: str = "table",
+        color: Optional[bool] = None,
+        stream: Optional[TextIO] = None
+    ):
+        """
+        Initialize a renderer.
+
+        Args:
+            fmt (str): Output format for task lists
+            color (bool, optional): Force colors on or off; None detects from the stream
+            stream (TextIO, optional): Output stream; defaults to sys.stdout at write time
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported output format: {fmt}")
+        self.fmt = fmt
+        self.color = color
+        self._stream = stream
+        self._buffer: List[str] = []
+
+    @property
+    def stream(self) -> TextIO:
+        """Return the output stream, resolving sys.stdout lazily."""
+        return self._stream if self._stream is not None else sys.stdout
+
+    def use_color(self) -> bool:
+        """Return True if ANSI color codes should be emitted."""
+        if self.color is not None:
+            return self.color
+        return stream_supports_color(self.stream)
+
+    def line(self, text: str = "") -> None:
+        """Append a line of text to the buffer."""
+        self._buffer.append(text)
+
+    def colored(self, text: str, code: str) -> None:
+        """Append a line wrapped in an ANSI color code when colors are enabled."""
+        if self.use_color():
+            self._buffer.append(f"{code}{text}{RESET}")
+        else:
+            self._buffer.append(text)
+
+    def success(self, message: str) -> None:
+        """Append a success message (green on terminals)."""
+        self.colored(message, GREEN)
+
+    def error(self, message: str) -> None:
+        """Append an error message (red on terminals)."""
+        self.colored(message, RED)
+
+    def menu(self) -> None:
+        """Append the main menu options."""
+        self._buffer.extend((
+            "\n" + "=" * 40,
+            "TODO APPLICATION - Interactive Menu",
+            "=" * 40,
+            "1. Add a new task",
+            "2. List all tasks",
+            "3. Update a task",
+            "4. Mark task as complete",
+            "5. Mark task as incomplete",
+            "6. Delete a task",
+            "7. Exit",
+            "-" * 40,
+        ))
+
+    def tasks(self, tasks: Iterable) -> None:
+        """
+        Append a task list in the renderer's format.
+
+        Args:
+            tasks (Iterable): Tasks to render; each needs id, title, description and completed
+        """
+        if not isinstance(tasks, list):
+            tasks = list(tasks)
+
+        if self.fmt == "json":
+            self._buffer.append(json.dumps([
+                {
+                    "id": task.id,
+                    "title": task.title,
+                    "description": task.description,
+                    "completed": task.completed,
+                }
+                for task in tasks
+            ]))
+            return
+
+        if not tasks:
+            self._buffer.append("\nNo tasks found.")
+            return
+
+        append = self._buffer.append
+        if self.fmt == "compact":
+            for task in tasks:
+                status = "X" if task.completed else "O"
+                append(f"[{status}] {task.id}  {task.title}")
+            return
+
+        append("\nAll Tasks:")
+        append("-" * 50)
+        for task in tasks:
+            status = "X" if task.completed else "O"
+            append(f"[{status}] ID: {task.id}")
+            append(f"    Title: {task.title}")
+            if task.description:
+                append(f"    Description: {task.description}")
+            recurrence = getattr(task, "recurrence", None)
+            if recurrence is not None:
+                append(f"    Repeats: {recurrence.frequency} from {recurrence.start:%Y-%m-%d %H:%M}")
+            append("")
+
+    def render(self) -> str:
+        """Return the buffered output as a single string and clear the buffer."""
+        if not self._buffer:
+            return ""
+        self._buffer.append("")
+        text = "\n".join(self._buffer)
+        self._buffer.clear()
+        return text
+
+    def flush(self) -> None:
+        """Write the buffered output to the stream in a single call."""
+        text = self.render()
+        if text:
+            self.stream.write(text)
+            self.stream.flush()
@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterator, Optional, Tuple
+
+
+FREQUENCIES = ("daily", "weekly")
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """
+    Describes when a recurring task repeats.
+
+    Occurrences are computed arithmetically from the rule, so any time window can
+    be generated lazily without walking the occurrences that precede it. Times are
+    naive datetimes with whole-second precision; start and until are truncated to
+    the second so every occurrence can be addressed by an occurrence ID.
+
+    Attributes:
+        frequency (str): Either "daily" or "weekly"
+        start (datetime): Date and time of the first occurrence
+        interval (int): Repeat every N days or weeks
+        weekdays (tuple, optional): For weekly rules, the weekdays to repeat on
+            (0=Monday ... 6=Sunday); defaults to the weekday of start
+        until (datetime, optional): No occurrences after this moment
+        count (int, optional): Maximum number of occurrences
+    """
+
+    frequency: str
+    start: datetime
+    interval: int = 1
+    weekdays: Optional[Tuple[int, ...]] = None
+    until: Optional[datetime] = None
+    count: Optional[int] = None
+
+    def __post_init__(self):
+        """
+        Validates the rule after initialization.
+        """
+        for name in ("start", "until"):
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if value.tzinfo is not None:
+                raise ValueError(f"Recurrence {name} must be a naive datetime")
+            object.__setattr__(self, name, value.replace(microsecond=0))
+        if self.frequency not in FREQUENCIES:
+            raise ValueError(f"Unsupported recurrence frequency: {self.frequency}")
+        if self.interval < 1:
+            raise ValueError("Recurrence interval must be at least 1")
+        if self.count is not None and self.count < 1:
+            raise ValueError("Recurrence count must be at least 1")
+        if self.weekdays is not None:
+            if self.frequency != "weekly":
+                raise ValueError("Weekdays are only supported for weekly recurrence")
+            weekdays = tuple(sorted(set(self.weekdays)))
+            if not weekdays or not all(0 <= day <= 6 for day in weekdays):
+                raise ValueError("Weekdays must be integers from 0 (Monday) to 6 (Sunday)")
+            object.__setattr__(self, "weekdays", weekdays)
+
+    @property
+    def _step(self) -> timedelta:
+        """Length of one repeat period."""
+        if self.frequency == "daily":
+            return timedelta(days=self.interval)
+        return timedelta(weeks=self.interval)
+
+    @property
+    def _anchor(self) -> datetime:
+        """Start of the first period (the Monday of the start week for weekly rules)."""
+        if self.frequency == "daily":
+            return self.start
+        return self.start - timedelta(days=self.start.weekday())
+
+    @property
+    def _offsets(self) -> Tuple[timedelta, ...]:
+        """Offsets of the occurrences from the start of each period, in order."""
+        if self.frequency == "daily":
+            return (timedelta(0),)
+        weekdays = self.weekdays or (self.start.weekday(),)
+        return tuple(timedelta(days=day) for day in weekdays)
+
+    def _skipped(self, anchor: datetime, offsets: Tuple[timedelta, ...]) -> int:
+        """Number of slots in the first period that fall before the start."""
+        return sum(1 for offset in offsets if anchor + offset < self.start)
+
+    def between(
+        self, start: datetime, end: Optional[datetime] = None
+    ) -> Iterator[datetime]:
+        """
+        Generate occurrences in the window [start, end) in chronological order.
+
+        Args:
+            start (datetime): Beginning of the window (inclusive)
+            end (datetime, optional): End of the window (exclusive); None is unbounded
+
+        Returns:
+            Iterator[datetime]: A lazy stream of occurrence times
+        """
+        step, anchor, offsets = self._step, self._anchor, self._offsets
+        skipped = self._skipped(anchor, offsets)
+        period = max(0, (start - anchor) // step)
+
+        while True:
+            period_start = anchor + period * step
+            for slot, offset in enumerate(offsets):
+                when = period_start + offset
+                if when < self.start or when < start:
+                    continue
+                if end is not None and when >= end:
+                    return
+                if self.until is not None and when > self.until:
+                    return
+                if self.count is not None and period * len(offsets) + slot - skipped >= self.count:
+                    return
+                yield when
+            period += 1
+
+    def occurs_at(self, when: datetime) -> bool:
+        """
+        Check whether the rule has an occurrence at exactly the given time.
+
+        Args:
+            when (datetime): The time to check
+
+        Returns:
+            bool: True if an occurrence falls at that time
+        """
+        return next(self.between(when, when + timedelta(microseconds=1)), None) == when
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 from uuid import uuid4
+from .recurrence import RecurrenceRule
 
 
 @dataclass
@@ -13,12 +15,16 @@ class Task:
         title (str): Required title of the task (non-empty)
         description (str): Optional detailed description of the task
         completed (bool): Status of whether the task is completed or not
+        recurrence (RecurrenceRule): Optional rule making this a recurring task
+        due (datetime): For an occurrence of a recurring task, when it occurs
     """
     
     id: str
     title: str
     description: Optional[str] = None
     completed: bool = False
+    recurrence: Optional[RecurrenceRule] = None
+    due: Optional[datetime] = None
     
     def __post_init__(self):
         """
@@ -29,13 +35,19 @@ class Task:
             raise ValueError("Task title cannot be empty")
     
     @classmethod
-    def create_task(cls, title: str, description: Optional[str] = None) -> 'Task':
+    def create_task(
+        cls,
+        title: str,
+        description: Optional[str] = None,
+        recurrence: Optional[RecurrenceRule] = None
+    ) -> 'Task':
         """
         Creates a new Task instance with a generated UUID.
         
         Args:
             title (str): Required title of the task (non-empty)
             description (str, optional): Optional detailed description of the task
+            recurrence (RecurrenceRule, optional): Rule making this a recurring task
             
         Returns:
             Task: A new Task instance with a unique ID and incomplete status by default
@@ -44,5 +56,6 @@ class Task:
             id=str(uuid4()),
             title=title.strip(),
             description=description,
-            completed=False
+            completed=False,
+            recurrence=recurrence
         )
\ No newline at end of file
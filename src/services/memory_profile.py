@@ -0,0 +1,282 @@
+"""
+Memory profiling for TodoService.
+Runs a scripted workload under tracemalloc and reports the memory cost of each
+task, the top allocation sites per service method, and how traced memory grows
+across the workload.
+"""
+import dis
+import os
+import tracemalloc
+from dataclasses import dataclass, field
+from types import CodeType
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+from .todo_service import TodoService
+
+
+# Frames kept per allocation, enough to reach the src/ frame under each service call
+TRACEBACK_FRAMES = 8
+
+# Calls per method after the bulk add; every lookup scans the task list, so larger
+# samples mostly add profiling time
+SAMPLE_CALLS = 200
+
+# Allocation sites are reported at the innermost frame inside the src package
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+
+
+def _site(traceback: tracemalloc.Traceback) -> Optional[tracemalloc.Frame]:
+    """
+    Return the frame an allocation is attributed to, or None if it is profiler overhead.
+
+    Allocations are attributed to the innermost frame inside src/, so a call into
+    the standard library (uuid, str) is reported at the service or model line that
+    made it. Frames of the service's locking wrapper are skipped, so allocations
+    made while calling a method count towards its caller.
+    """
+    innermost = traceback[-1]
+    if innermost.filename in (tracemalloc.__file__, "<unknown>"):
+        return None
+    fallback = None
+    for frame in reversed(traceback):
+        if frame.filename == _WRAPPER_FILE and frame.lineno in _WRAPPER_LINES:
+            continue
+        if fallback is None:
+            fallback = frame
+        if frame.filename.startswith(_SRC_DIR):
+            if frame.filename == __file__ and frame.lineno in _OVERHEAD_LINES:
+                return None
+            return frame
+    return fallback
+
+
+@dataclass
+class AllocationSite:
+    """
+    A source line and the memory it allocated during a phase.
+
+    Attributes:
+        location (str): "file:line" of the allocation
+        size_diff (int): Net bytes allocated at this line
+        count_diff (int): Net number of blocks allocated at this line
+    """
+
+    location: str
+    size_diff: int
+    count_diff: int
+
+
+@dataclass
+class PhaseReport:
+    """
+    Memory usage of one phase of the workload (a batch of calls to one method).
+
+    Attributes:
+        method (str): Name of the TodoService method exercised
+        calls (int): Number of calls made
+        size_diff (int): Net bytes retained after the phase
+        current (int): Total traced bytes after the phase
+        peak (int): Peak traced bytes during the phase
+        top_sites (list): Allocation sites with the largest net allocations
+    """
+
+    method: str
+    calls: int
+    size_diff: int
+    current: int
+    peak: int
+    top_sites: List[AllocationSite] = field(default_factory=list)
+
+
+@dataclass
+class MemoryReport:
+    """
+    Result of profiling a workload.
+
+    Attributes:
+        tasks (int): Number of tasks added by the workload
+        bytes_per_task (float): Net bytes retained per added task
+        phases (list): Per-method phase reports, in workload order
+    """
+
+    tasks: int
+    bytes_per_task: float
+    phases: List[PhaseReport] = field(default_factory=list)
+
+
+# Per-site totals of a snapshot: (bytes outside profiler overhead, site -> [bytes, blocks])
+_Summary = Tuple[int, Dict[str, List[int]]]
+
+
+def _summarize() -> _Summary:
+    """Take a snapshot and total its traced memory by allocation site."""
+    total = 0
+    sites: Dict[str, List[int]] = {}
+    for stat in tracemalloc.take_snapshot().statistics("traceback"):
+        frame = _site(stat.traceback)
+        if frame is None:
+            continue
+        total += stat.size
+        # Inputs built by the workload driver (titles, descriptions) count towards
+        # the total but are not service or model allocation sites
+        if frame.filename == __file__:
+            continue
+        totals = sites.setdefault(f"{frame.filename}:{frame.lineno}", [0, 0])
+        totals[0] += stat.size
+        totals[1] += stat.count
+    return total, sites
+
+
+def _measure(
+    method: str,
+    calls: int,
+    func: Callable[[], None],
+    before: _Summary,
+    top: int
+) -> Tuple[PhaseReport, _Summary]:
+    """
+    Run func and summarize the difference from the previous snapshot summary.
+
+    Returns the phase report and the new summary, which serves as the baseline
+    of the next phase, so each snapshot is grouped only once.
+    """
+    tracemalloc.reset_peak()
+    func()
+    current, peak = tracemalloc.get_traced_memory()
+    after = _summarize()
+
+    before_total, before_sites = before
+    after_total, after_sites = after
+    diffs = []
+    for location in after_sites.keys() | before_sites.keys():
+        size, count = after_sites.get(location, (0, 0))
+        old_size, old_count = before_sites.get(location, (0, 0))
+        if size != old_size:
+            diffs.append(AllocationSite(location, size - old_size, count - old_count))
+    diffs.sort(key=lambda site: abs(site.size_diff), reverse=True)
+
+    report = PhaseReport(
+        method, calls, after_total - before_total, current, peak, diffs[:top]
+    )
+    return report, after
+
+
+def profile_workload(
+    tasks: int = 10_000,
+    top: int = 5,
+    service_factory: Callable[[], TodoService] = TodoService
+) -> MemoryReport:
+    """
+    Profile a scripted workload against a fresh service.
+
+    The workload adds the given number of tasks, then lists them and runs a
+    sample of lookups, updates, status changes and deletes.
+
+    Args:
+        tasks (int): Number of tasks to add
+        top (int): Number of allocation sites to report per method
+        service_factory (callable): Builds the service to profile
+
+    Returns:
+        MemoryReport: Bytes per task and per-method phase reports
+
+    Raises:
+        ValueError: If tasks is less than 1
+    """
+    if tasks < 1:
+        raise ValueError("Workload must add at least one task")
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(TRACEBACK_FRAMES)
+    try:
+        service = service_factory()
+        sample = min(tasks, SAMPLE_CALLS)
+
+        def add():
+            for i in range(tasks):
+                service.add_task(f"Task {i}", f"Description for task {i}")
+
+        summary = _summarize()
+        report, summary = _measure("add_task", tasks, add, summary, top)
+        phases = [report]
+        ids: List[str] = [task.id for task in service.get_all_tasks()][:sample]
+
+        workload: List[Tuple[str, int, Callable[[], None]]] = [
+            ("get_all_tasks", 10, lambda: [service.get_all_tasks() for _ in range(10)]),
+            ("get_task_by_id", sample, lambda: [service.get_task_by_id(i) for i in ids]),
+            ("update_task", sample, lambda: [
+                service.update_task(i, description=f"Updated {n}") for n, i in enumerate(ids)
+            ]),
+            ("mark_task_complete", sample, lambda: [service.mark_task_complete(i) for i in ids]),
+            ("mark_task_incomplete", sample, lambda: [service.mark_task_incomplete(i) for i in ids]),
+            ("delete_task", sample, lambda: [service.delete_task(i) for i in ids]),
+        ]
+        # The ID sample and the workload list are allocated between phases
+        summary = _summarize()
+        for method, calls, func in workload:
+            report, summary = _measure(method, calls, func, summary, top)
+            phases.append(report)
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    return MemoryReport(tasks, phases[0].size_diff / tasks, phases)
+
+
+def _code_lines(code: CodeType, nested: bool = True) -> FrozenSet[int]:
+    """Return the source lines of a code object, optionally including nested code."""
+    lines = {lineno for _, lineno in dis.findlinestarts(code) if lineno}
+    if nested:
+        for const in code.co_consts:
+            if isinstance(const, CodeType):
+                lines |= _code_lines(const)
+    return frozenset(lines)
+
+
+# Lines of this module whose allocations are profiler bookkeeping: all of
+# _summarize and _measure, and the body of profile_workload itself. The workload
+# functions it defines (add() and the lambdas) are nested code objects and so are
+# not included.
+_OVERHEAD_LINES = (
+    _code_lines(_summarize.__code__)
+    | _code_lines(_measure.__code__)
+    | _code_lines(profile_workload.__code__, nested=False)
+)
+
+# The lock wrapper shared by the TodoService write methods, which is not a site
+_WRAPPER_FILE = TodoService.add_task.__code__.co_filename
+_WRAPPER_LINES = _code_lines(TodoService.add_task.__code__)
+
+
+def format_report(report: MemoryReport) -> List[str]:
+    """
+    Format a memory report as lines of text.
+
+    Args:
+        report (MemoryReport): The report to format
+
+    Returns:
+        List[str]: Lines ready to be printed
+    """
+    lines = [
+        f"Memory profile: {report.tasks} tasks",
+        f"Bytes per task: {report.bytes_per_task:,.1f}",
+        "",
+        f"{'Method':<22}{'Calls':>8}{'Net bytes':>14}{'Traced':>14}{'Peak':>14}",
+        "-" * 72,
+    ]
+    for phase in report.phases:
+        lines.append(
+            f"{phase.method:<22}{phase.calls:>8}{phase.size_diff:>+14,}"
+            f"{phase.current:>14,}{phase.peak:>14,}"
+        )
+    for phase in report.phases:
+        lines.append("")
+        lines.append(f"Top allocation sites: {phase.method}")
+        if not phase.top_sites:
+            lines.append("    (no net allocations)")
+        for site in phase.top_sites:
+            lines.append(
+                f"    {site.size_diff:>+12,} B {site.count_diff:>+8,} blocks  {site.location}"
+            )
+    return lines
@@ -1,34 +1,42 @@
-from typing import List, Optional
+import heapq
+import threading
+from dataclasses import replace
+from datetime import datetime
+from functools import wraps
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from ..models.recurrence import RecurrenceRule
 from ..models.task import Task
 
 
-class TodoService:
+OCCURRENCE_SEPARATOR = "@"
+OCCURRENCE_TIME_FORMAT = "%Y%m%dT%H%M%S"
+
+# Changed fields of one occurrence, applied on top of its recurring task
+Overrides = Dict[str, Any]
+
+
+def occurrence_id(task_id: str, when: datetime) -> str:
+    """Build the ID of the occurrence of a recurring task at a given time."""
+    return f"{task_id}{OCCURRENCE_SEPARATOR}{when.strftime(OCCURRENCE_TIME_FORMAT)}"
+
+
+def _synchronized(method):
+    """Run a TodoService method while holding the service's write lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class _TaskReader:
     """
-    Service class that handles all business logic for todo operations.
-    Manages a collection of tasks in memory.
+    Read operations shared by TodoService and its snapshots.
+    Subclasses provide the _tasks list and the _exceptions map.
     """
     
-    def __init__(self):
-        """Initialize an empty list of tasks."""
-        self._tasks: List[Task] = []
-    
-    def add_task(self, title: str, description: Optional[str] = None) -> Task:
-        """
-        Add a new task to the collection.
-        
-        Args:
-            title (str): Required title of the task (non-empty)
-            description (str, optional): Optional detailed description of the task
-            
-        Returns:
-            Task: The newly created task with a unique ID and incomplete status
-            
-        Raises:
-            ValueError: If the title is empty
-        """
-        task = Task.create_task(title, description)
-        self._tasks.append(task)
-        return task
+    _tasks: List[Task]
+    _exceptions: Dict[str, Dict[datetime, Optional[Overrides]]]
     
     def get_all_tasks(self) -> List[Task]:
         """
@@ -45,19 +53,293 @@ class TodoService:
         
         Args:
             task_id (str): The ID of the task to retrieve
-            
+        
         Returns:
             Task: The task with the specified ID, or None if not found
+        
+        Once a snapshot has been taken, a later write may replace the stored task
+        with a copy, so the returned object only reflects writes made before then.
+        """
+        task = self._find_task(task_id)
+        if task is not None:
+            return task
+        found = self._find_occurrence(task_id)
+        if found is None:
+            return None
+        parent, when = found
+        return self._occurrence(parent, when)
+    
+    def get_occurrences(
+        self, start: datetime, end: Optional[datetime] = None
+    ) -> Iterator[Task]:
+        """
+        Stream occurrences of all recurring tasks within a time window.
+        
+        Occurrences are generated lazily and merged in chronological order, so an
+        unbounded window can be consumed incrementally.
+        
+        Args:
+            start (datetime): Beginning of the window (inclusive)
+            end (datetime, optional): End of the window (exclusive); None is unbounded
+        
+        Returns:
+            Iterator[Task]: Occurrences ordered by their due time
         """
+        streams = [
+            self._iter_occurrences(task, start, end)
+            for task in self._tasks
+            if task.recurrence is not None
+        ]
+        return heapq.merge(*streams, key=lambda occurrence: occurrence.due)
+    
+    def _iter_occurrences(
+        self, task: Task, start: datetime, end: Optional[datetime]
+    ) -> Iterator[Task]:
+        """Generate the occurrences of one recurring task, applying exceptions."""
+        exceptions = self._exceptions.get(task.id, {})
+        for when in task.recurrence.between(start, end):
+            overrides = exceptions.get(when, {})
+            if overrides is not None:
+                yield self._make_occurrence(task, when, overrides)
+    
+    def _make_occurrence(
+        self, task: Task, when: datetime, overrides: Optional[Overrides] = None
+    ) -> Task:
+        """Build an occurrence of a recurring task, applying any changed fields."""
+        fields = {"title": task.title, "description": task.description}
+        if overrides:
+            fields.update(overrides)
+        return Task(id=occurrence_id(task.id, when), due=when, **fields)
+    
+    def _occurrence(self, task: Task, when: datetime) -> Optional[Task]:
+        """Return the occurrence at a given time, or None if it was deleted."""
+        overrides = self._exceptions.get(task.id, {}).get(when, {})
+        if overrides is None:
+            return None
+        return self._make_occurrence(task, when, overrides)
+    
+    def _find_occurrence(self, task_id: str) -> Optional[Tuple[Task, datetime]]:
+        """Resolve an occurrence ID to its recurring task and occurrence time."""
+        parent_id, separator, stamp = task_id.rpartition(OCCURRENCE_SEPARATOR)
+        if not separator:
+            return None
+        try:
+            when = datetime.strptime(stamp, OCCURRENCE_TIME_FORMAT)
+        except ValueError:
+            return None
+        # strptime accepts unpadded fields, so only the canonical spelling is an ID
+        if occurrence_id(parent_id, when) != task_id:
+            return None
+        parent = self._find_task(parent_id)
+        if parent is not None and parent.recurrence is not None:
+            if parent.recurrence.occurs_at(when):
+                return parent, when
+        return None
+    
+    def _find_index(self, task_id: str) -> Optional[int]:
+        """Return the position of the stored task with the given ID."""
+        for index, task in enumerate(self._tasks):
+            if task.id == task_id:
+                return index
+        return None
+    
+    def _find_task(self, task_id: str) -> Optional[Task]:
+        """Return the stored task with the given ID, ignoring occurrence IDs."""
         for task in self._tasks:
             if task.id == task_id:
                 return task
         return None
+
+
+class TaskSnapshot(_TaskReader):
+    """
+    Immutable, point-in-time view of a TodoService.
+    
+    Taking a snapshot is O(1): the snapshot shares the service's storage, and the
+    service copies that storage on its next write instead of changing it in place.
+    Tasks returned by a snapshot must be treated as read-only.
+    """
+    
+    def __init__(
+        self,
+        tasks: List[Task],
+        exceptions: Dict[str, Dict[datetime, Optional[Overrides]]]
+    ):
+        """Initialize a view over storage that its service will no longer modify."""
+        self._tasks = tasks
+        self._exceptions = exceptions
+    
+    def __len__(self) -> int:
+        """Return the number of tasks in the snapshot."""
+        return len(self._tasks)
+    
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over the tasks in the snapshot without copying them."""
+        return iter(self._tasks)
+
+
+class TodoService(_TaskReader):
+    """
+    Service class that handles all business logic for todo operations.
+    Manages a collection of tasks in memory.
+    
+    Recurring tasks are stored once, as their rule. Occurrences are generated on
+    demand and addressed by occurrence IDs ("<task id>@<YYYYMMDDTHHMMSS>"); only
+    occurrences that were completed, updated or deleted are stored, as exceptions
+    holding just the fields that differ from the recurring task.
+    
+    After snapshot() is called, writes are copy-on-write: the task list, the
+    exceptions map, and each task or per-task exception table are copied on their
+    first write after the snapshot, whether or not the snapshot is still in use.
+    Before any snapshot is taken, tasks are modified in place.
+
+    Writes and snapshot() are serialized by a lock, so a snapshot taken on one
+    thread is consistent while writers on other threads keep going. Reading the
+    service directly while another thread writes is not isolated; use a snapshot.
+    """
+    
+    def __init__(self):
+        """Initialize an empty list of tasks."""
+        self._tasks: List[Task] = []
+        # Recurring task ID -> occurrence time -> changed fields (None if deleted)
+        self._exceptions: Dict[str, Dict[datetime, Optional[Overrides]]] = {}
+        # Copy-on-write state: whether any snapshot was taken, whether the
+        # containers are still shared with the latest one, and the IDs copied since
+        self._lock = threading.Lock()
+        self._snapshot_taken = False
+        self._tasks_shared = False
+        self._exceptions_shared = False
+        self._owned_tasks: Set[str] = set()
+        self._owned_exceptions: Set[str] = set()
+    
+    @_synchronized
+    def snapshot(self) -> TaskSnapshot:
+        """
+        Take an immutable, consistent view of the current tasks.
+        
+        The snapshot is created in O(1) and can be read for as long as needed,
+        from any thread; later writes to the service are not visible through it.
+        
+        Returns:
+            TaskSnapshot: A read-only view supporting the service's read methods
+        """
+        snapshot = TaskSnapshot(self._tasks, self._exceptions)
+        self._snapshot_taken = True
+        self._tasks_shared = True
+        self._exceptions_shared = True
+        self._owned_tasks = set()
+        self._owned_exceptions = set()
+        return snapshot
+    
+    def _writable_tasks(self) -> List[Task]:
+        """Return the task list, copying it first if a snapshot shares it."""
+        if self._tasks_shared:
+            self._tasks = self._tasks.copy()
+            self._tasks_shared = False
+        return self._tasks
+    
+    def _writable_task(self, task_id: str) -> Optional[Task]:
+        """Return a stored task that is safe to modify, copying it if a snapshot shares it."""
+        index = self._find_index(task_id)
+        if index is None:
+            return None
+        task = self._tasks[index]
+        if self._snapshot_taken and task.id not in self._owned_tasks:
+            task = replace(task)
+            self._writable_tasks()[index] = task
+            self._owned_tasks.add(task.id)
+        return task
+    
+    def _writable_exceptions(self) -> Dict[str, Dict[datetime, Optional[Overrides]]]:
+        """Return the exceptions map, copying it first if a snapshot shares it."""
+        if self._exceptions_shared:
+            self._exceptions = self._exceptions.copy()
+            self._exceptions_shared = False
+        return self._exceptions
+    
+    def _writable_exceptions_for(self, task_id: str) -> Dict[datetime, Optional[Overrides]]:
+        """Return the exceptions of one recurring task, safe to modify."""
+        exceptions = self._writable_exceptions()
+        table = exceptions.get(task_id)
+        if table is None:
+            table = exceptions[task_id] = {}
+            if self._snapshot_taken:
+                self._owned_exceptions.add(task_id)
+        elif self._snapshot_taken and task_id not in self._owned_exceptions:
+            table = exceptions[task_id] = table.copy()
+            self._owned_exceptions.add(task_id)
+        return table
+    
+    @_synchronized
+    def add_task(
+        self,
+        title: str,
+        description: Optional[str] = None,
+        recurrence: Optional[RecurrenceRule] = None
+    ) -> Task:
+        """
+        Add a new task to the collection.
+        
+        Args:
+            title (str): Required title of the task (non-empty)
+            description (str, optional): Optional detailed description of the task
+            recurrence (RecurrenceRule, optional): Rule making this a recurring task
+        
+        Returns:
+            Task: The newly created task with a unique ID and incomplete status
+        
+        Raises:
+            ValueError: If the title is empty
+        
+        Once a snapshot has been taken, a later write may replace the stored task
+        with a copy, so the returned object only reflects writes made before then;
+        use get_task_by_id() to read the current state.
+        """
+        task = Task.create_task(title, description, recurrence)
+        self._writable_tasks().append(task)
+        if self._snapshot_taken:
+            self._owned_tasks.add(task.id)
+        return task
+    
+    def _store_occurrence(self, task: Task, when: datetime, overrides: Overrides) -> None:
+        """Record the changed fields of an occurrence, dropping them if there are none."""
+        exceptions = self._writable_exceptions_for(task.id)
+        if overrides:
+            exceptions[when] = overrides
+            return
+        exceptions.pop(when, None)
+        if not exceptions:
+            del self._writable_exceptions()[task.id]
+            self._owned_exceptions.discard(task.id)
     
+    def _update_occurrence(self, task_id: str, **changes) -> Optional[Task]:
+        """
+        Apply changes to an occurrence and store it as an exception.
+        
+        Only fields that differ from the recurring task are kept, so later changes
+        to the task still show through every field the occurrence did not change.
+        """
+        found = self._find_occurrence(task_id)
+        if found is None:
+            return None
+        parent, when = found
+        overrides = self._exceptions.get(parent.id, {}).get(when, {})
+        if overrides is None:
+            return None
+        base = self._make_occurrence(parent, when)
+        overrides = {**overrides, **changes}
+        overrides = {
+            name: value for name, value in overrides.items()
+            if value != getattr(base, name)
+        }
+        self._store_occurrence(parent, when, overrides)
+        return self._make_occurrence(parent, when, overrides)
+    
+    @_synchronized
     def update_task(
-        self, 
-        task_id: str, 
-        title: Optional[str] = None, 
+        self,
+        task_id: str,
+        title: Optional[str] = None,
         description: Optional[str] = None
     ) -> Optional[Task]:
         """
@@ -67,69 +349,96 @@ class TodoService:
             task_id (str): The ID of the task to update
             title (str, optional): New title for the task
             description (str, optional): New description for the task
-            
+        
         Returns:
             Task: The updated task, or None if the task with the given ID was not found
         """
-        task = self.get_task_by_id(task_id)
-        if task is None:
-            return None
-        
         if title is not None:
             title = title.strip()
-            if not title:
+        
+        if self._find_index(task_id) is None:
+            occurrence = self.get_task_by_id(task_id)
+            if occurrence is None:
+                return None
+            if title is not None and not title:
                 raise ValueError("Task title cannot be empty")
+            changes = {}
+            if title is not None:
+                changes["title"] = title
+            if description is not None:
+                changes["description"] = description
+            return self._update_occurrence(task_id, **changes)
+        
+        if title is not None and not title:
+            raise ValueError("Task title cannot be empty")
+        
+        task = self._writable_task(task_id)
+        if title is not None:
             task.title = title
         
         if description is not None:
             task.description = description
-            
+        
         return task
     
+    @_synchronized
     def delete_task(self, task_id: str) -> bool:
         """
         Delete a task by its ID.
         
         Args:
             task_id (str): The ID of the task to delete
-            
+        
         Returns:
             bool: True if the task was successfully deleted, False if not found
         """
-        task_to_remove = self.get_task_by_id(task_id)
-        if task_to_remove:
-            self._tasks.remove(task_to_remove)
+        index = self._find_index(task_id)
+        if index is not None:
+            del self._writable_tasks()[index]
+            if task_id in self._exceptions:
+                del self._writable_exceptions()[task_id]
+            self._owned_tasks.discard(task_id)
+            self._owned_exceptions.discard(task_id)
             return True
-        return False
+        found = self._find_occurrence(task_id)
+        if found is None:
+            return False
+        parent, when = found
+        if self._occurrence(parent, when) is None:
+            return False
+        self._writable_exceptions_for(parent.id)[when] = None
+        return True
     
+    @_synchronized
     def mark_task_complete(self, task_id: str) -> bool:
         """
         Mark a task as complete by its ID.
         
         Args:
             task_id (str): The ID of the task to mark as complete
-            
+        
         Returns:
             bool: True if the task was successfully marked as complete, False if not found
         """
-        task = self.get_task_by_id(task_id)
+        task = self._writable_task(task_id)
         if task:
             task.completed = True
             return True
-        return False
+        return self._update_occurrence(task_id, completed=True) is not None
     
+    @_synchronized
     def mark_task_incomplete(self, task_id: str) -> bool:
         """
         Mark a task as incomplete by its ID.
         
         Args:
             task_id (str): The ID of the task to mark as incomplete
-            
+        
         Returns:
             bool: True if the task was successfully marked as incomplete, False if not found
         """
-        task = self.get_task_by_id(task_id)
+        task = self._writable_task(task_id)
         if task:
             task.completed = False
             return True
-        return False
\ No newline at end of file
+        return self._update_occurrence(task_id, completed=False) is not None
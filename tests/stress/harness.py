@@ -0,0 +1,395 @@
+"""
+Randomized stress harness for TodoService implementations.
+Replays long random sequences of operations against an implementation and a
+simple reference model, checking that every result and the listed state match.
+"""
+import random
+from itertools import islice
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+from src.models.recurrence import RecurrenceRule
+
+
+# Implementations under test. Register an alternative backend by appending a
+# zero-argument factory that returns an object with the TodoService interface.
+def _todo_service():
+    from src.services.todo_service import TodoService
+    return TodoService()
+
+
+IMPLEMENTATIONS: Dict[str, Callable[[], object]] = {
+    "list": _todo_service,
+}
+
+OPERATIONS = (
+    "add", "recurring", "update", "complete", "incomplete", "delete",
+    "list", "get", "occurrences", "snapshot", "iterate_snapshot",
+)
+
+# Number of snapshots kept alive at once by the "snapshot" operation
+MAX_SNAPSHOTS = 4
+
+# Recurring tasks start within the week after BASE; "occurrences" lists WINDOW from BASE
+BASE = datetime(2026, 1, 5)
+WINDOW = timedelta(days=14)
+
+TaskState = Tuple[str, str, Optional[str], bool]
+
+
+def occurrence_key(task_id: str, when: datetime) -> str:
+    """Build an occurrence ID in the format the service interface documents."""
+    return f"{task_id}@{when:%Y%m%dT%H%M%S}"
+
+
+class ReferenceModel:
+    """
+    Straightforward model of the TodoService semantics.
+    Tasks are kept in insertion order; IDs are taken from the implementation.
+
+    Occurrences of recurring tasks are addressable only once the harness has
+    registered their IDs. Changed or deleted occurrences are kept as overrides
+    holding only the values that differ from the recurring task, so later changes
+    to the task still show through everything else.
+    """
+
+    def __init__(self):
+        """Initialize an empty model."""
+        self.tasks: Dict[str, List] = {}
+        self.occurrence_ids: Dict[str, Tuple[str, datetime]] = {}
+        self.overrides: Dict[str, Dict[datetime, Optional[Dict[int, object]]]] = {}
+
+    def add(
+        self,
+        task_id: str,
+        title: str,
+        description: Optional[str],
+        rule: Optional[RecurrenceRule] = None
+    ) -> TaskState:
+        """Record a newly added task."""
+        title = title.strip()
+        self.tasks[task_id] = [title, description, False, rule]
+        return (task_id, title, description, False)
+
+    def register_occurrence(self, task_id: str, when: datetime) -> str:
+        """Make an occurrence of a recurring task addressable and return its ID."""
+        key = occurrence_key(task_id, when)
+        self.occurrence_ids[key] = (task_id, when)
+        return key
+
+    def _occurrence(self, key: str) -> Optional[Tuple[str, datetime, List]]:
+        """Resolve an occurrence ID to its parent, time and current values."""
+        ref = self.occurrence_ids.get(key)
+        if ref is None or ref[0] not in self.tasks:
+            return None
+        parent_id, when = ref
+        changed = self.overrides.get(parent_id, {}).get(when, {})
+        if changed is None:
+            return None
+        values = self._generated(parent_id)
+        for index, value in changed.items():
+            values[index] = value
+        return (parent_id, when, values)
+
+    def _generated(self, parent_id: str) -> List:
+        """Return the values of an unchanged occurrence of a recurring task."""
+        parent = self.tasks[parent_id]
+        return [parent[0], parent[1], False]
+
+    def _store(self, parent_id: str, when: datetime, values: List) -> None:
+        """Record the occurrence values that differ from the parent, if any."""
+        generated = self._generated(parent_id)
+        changed = {i: value for i, value in enumerate(values) if value != generated[i]}
+        overrides = self.overrides.setdefault(parent_id, {})
+        if changed:
+            overrides[when] = changed
+        else:
+            overrides.pop(when, None)
+            if not overrides:
+                del self.overrides[parent_id]
+
+    def update(
+        self, task_id: str, title: Optional[str], description: Optional[str]
+    ) -> Optional[TaskState]:
+        """Apply an update, mirroring TodoService.update_task."""
+        task = self.tasks.get(task_id)
+        if task is None:
+            occurrence = self._occurrence(task_id)
+            if occurrence is None:
+                return None
+            parent_id, when, task = occurrence
+        if title is not None:
+            title = title.strip()
+            if not title:
+                raise ValueError("Task title cannot be empty")
+            task[0] = title
+        if description is not None:
+            task[1] = description
+        if task_id not in self.tasks:
+            self._store(parent_id, when, task)
+        return (task_id, task[0], task[1], task[2])
+
+    def set_completed(self, task_id: str, completed: bool) -> bool:
+        """Set the completion status of a task or occurrence."""
+        task = self.tasks.get(task_id)
+        if task is not None:
+            task[2] = completed
+            return True
+        occurrence = self._occurrence(task_id)
+        if occurrence is None:
+            return False
+        parent_id, when, values = occurrence
+        values[2] = completed
+        self._store(parent_id, when, values)
+        return True
+
+    def delete(self, task_id: str) -> bool:
+        """Remove a task, or skip a single occurrence."""
+        if self.tasks.pop(task_id, None) is not None:
+            self.overrides.pop(task_id, None)
+            return True
+        occurrence = self._occurrence(task_id)
+        if occurrence is None:
+            return False
+        parent_id, when, _ = occurrence
+        self.overrides.setdefault(parent_id, {})[when] = None
+        return True
+
+    def get(self, task_id: str) -> Optional[TaskState]:
+        """Return a task's or occurrence's state, or None if not found."""
+        task = self.tasks.get(task_id)
+        if task is None:
+            occurrence = self._occurrence(task_id)
+            if occurrence is None:
+                return None
+            task = occurrence[2]
+        return (task_id, task[0], task[1], task[2])
+
+    def occurrences(self, start: datetime, end: datetime) -> List[TaskState]:
+        """Return the occurrences in [start, end), ordered by time then task order."""
+        found = []
+        for order, (task_id, task) in enumerate(self.tasks.items()):
+            rule = task[3]
+            if rule is None:
+                continue
+            for when in rule.between(start, end):
+                key = occurrence_key(task_id, when)
+                self.occurrence_ids.setdefault(key, (task_id, when))
+                state = self.get(key)
+                if state is not None:
+                    found.append((when, order, state))
+        found.sort(key=lambda item: item[:2])
+        return [state for _, _, state in found]
+
+    def state(self) -> List[TaskState]:
+        """Return the state of all tasks in insertion order."""
+        return [(task_id, t[0], t[1], t[2]) for task_id, t in self.tasks.items()]
+
+
+def task_state(task) -> Optional[TaskState]:
+    """Convert a task (or None) into a comparable tuple."""
+    if task is None:
+        return None
+    return (task.id, task.title, task.description, task.completed)
+
+
+def _random_title(rng: random.Random) -> str:
+    """Return a random title, sometimes blank or padded with spaces."""
+    roll = rng.random()
+    if roll < 0.03:
+        return ""
+    if roll < 0.06:
+        return "   "
+    if roll < 0.1:
+        return f"  padded {rng.randrange(1000)}  "
+    return f"task {rng.randrange(1_000_000)}"
+
+
+def _random_description(rng: random.Random) -> Optional[str]:
+    """Return a random description, sometimes None or empty."""
+    roll = rng.random()
+    if roll < 0.4:
+        return None
+    if roll < 0.45:
+        return ""
+    return f"description {rng.randrange(1_000_000)}"
+
+
+def _pick_id(rng: random.Random, known_ids: List[str]) -> str:
+    """Pick a previously issued ID (live or deleted) or, occasionally, an unknown one."""
+    if known_ids and rng.random() < 0.9:
+        return known_ids[rng.randrange(len(known_ids))]
+    return f"missing-{rng.randrange(1_000_000)}"
+
+
+def _random_rule(rng: random.Random) -> RecurrenceRule:
+    """Return a random daily or weekly rule starting within a week of BASE."""
+    start = BASE + timedelta(hours=rng.randrange(24 * 7), minutes=rng.choice((0, 30)))
+    count = rng.choice((None, None, 2, 5))
+    until = rng.choice((None, None, start + timedelta(days=rng.randrange(1, 10))))
+    if rng.random() < 0.5:
+        return RecurrenceRule("daily", start, rng.randint(1, 3), until=until, count=count)
+    weekdays = tuple(rng.sample(range(7), rng.randint(1, 3))) if rng.random() < 0.7 else None
+    return RecurrenceRule("weekly", start, rng.randint(1, 2), weekdays, until, count)
+
+
+def check_snapshots(snapshots: List[Tuple[object, List[TaskState]]], context: str = "") -> None:
+    """Check that each held snapshot still lists exactly the state it was taken with."""
+    for snapshot, expected in snapshots:
+        assert [task_state(t) for t in snapshot] == expected, f"{context} snapshot diverged"
+        for state in expected[:3]:
+            assert task_state(snapshot.get_task_by_id(state[0])) == state, context
+
+
+def _call(func, *args):
+    """Call func and return ("ok", result) or ("error", exception type and message)."""
+    try:
+        return ("ok", func(*args))
+    except ValueError as e:
+        return ("error", (ValueError, str(e)))
+
+
+def run_workload(
+    service,
+    steps: int,
+    seed: int,
+    weights: Optional[Dict[str, int]] = None,
+    check_every: int = 1
+) -> ReferenceModel:
+    """
+    Run a random workload against a service and a reference model.
+
+    Args:
+        service: The TodoService-like object under test
+        steps (int): Number of random operations to perform
+        seed (int): Seed for the random generator, so failures are reproducible
+        weights (dict, optional): Relative weight of each operation name
+        check_every (int): Compare the full listed state every N steps
+
+    Returns:
+        ReferenceModel: The model after the workload, matching the service
+
+    Raises:
+        AssertionError: If the service diverges from the model
+    """
+    rng = random.Random(seed)
+    weights = weights or {
+        "add": 30, "recurring": 4, "update": 15, "complete": 12, "incomplete": 8,
+        "delete": 10, "list": 3, "get": 22, "occurrences": 2, "snapshot": 2,
+        "iterate_snapshot": 1,
+    }
+    names = list(weights)
+    op_weights = [weights[name] for name in names]
+    model = ReferenceModel()
+    known_ids: List[str] = []
+    seen_ids = set()
+    # Snapshots are optional; implementations without snapshot() skip that operation
+    snapshots: List[Tuple[object, List[TaskState]]] = []
+    supports_snapshots = hasattr(service, "snapshot")
+    # Likewise for recurring tasks, which need get_occurrences()
+    supports_recurrence = hasattr(service, "get_occurrences")
+
+    for step in range(steps):
+        op = rng.choices(names, weights=op_weights)[0]
+        context = f"seed={seed} step={step} op={op}"
+
+        if op in ("add", "recurring"):
+            rule = None
+            if op == "recurring":
+                if not supports_recurrence:
+                    continue
+                rule = _random_rule(rng)
+            title, description = _random_title(rng), _random_description(rng)
+            if rule is None:
+                outcome = _call(service.add_task, title, description)
+            else:
+                outcome = _call(
+                    lambda: service.add_task(title, description, recurrence=rule)
+                )
+            if not title.strip():
+                assert outcome == ("error", (ValueError, "Task title cannot be empty")), context
+                continue
+            assert outcome[0] == "ok", context
+            task = outcome[1]
+            assert task.id not in seen_ids, context
+            expected = model.add(task.id, title, description, rule)
+            seen_ids.add(task.id)
+            known_ids.append(task.id)
+            assert task_state(task) == expected, context
+            if rule is not None:
+                # Issue a few real occurrence IDs, one that is off the schedule and
+                # one that spells the first occurrence's seconds without zero padding
+                for when in list(islice(rule.between(rule.start), 3)):
+                    known_ids.append(model.register_occurrence(task.id, when))
+                known_ids.append(occurrence_key(task.id, rule.start + timedelta(minutes=1)))
+                known_ids.append(f"{task.id}@{rule.start:%Y%m%dT%H%M}0")
+        elif op == "update":
+            task_id = _pick_id(rng, known_ids)
+            title = _random_title(rng) if rng.random() < 0.7 else None
+            description = _random_description(rng)
+            expected = _call(model.update, task_id, title, description)
+            actual = _call(service.update_task, task_id, title, description)
+            if actual[0] == "ok":
+                actual = ("ok", task_state(actual[1]))
+            assert actual == expected, context
+        elif op in ("complete", "incomplete"):
+            task_id = _pick_id(rng, known_ids)
+            if op == "complete":
+                actual = service.mark_task_complete(task_id)
+            else:
+                actual = service.mark_task_incomplete(task_id)
+            assert actual == model.set_completed(task_id, op == "complete"), context
+        elif op == "delete":
+            task_id = _pick_id(rng, known_ids)
+            assert service.delete_task(task_id) == model.delete(task_id), context
+        elif op == "get":
+            task_id = _pick_id(rng, known_ids)
+            assert task_state(service.get_task_by_id(task_id)) == model.get(task_id), context
+        elif op == "occurrences":
+            if not supports_recurrence:
+                continue
+            actual = [task_state(t) for t in service.get_occurrences(BASE, BASE + WINDOW)]
+            assert actual == model.occurrences(BASE, BASE + WINDOW), context
+        elif op == "snapshot":
+            if not supports_snapshots:
+                continue
+            check_snapshots(snapshots, context)
+            entry = (service.snapshot(), model.state())
+            if len(snapshots) < MAX_SNAPSHOTS:
+                snapshots.append(entry)
+            else:
+                snapshots[rng.randrange(MAX_SNAPSHOTS)] = entry
+        elif op == "iterate_snapshot":
+            if not supports_snapshots:
+                continue
+            # Iterate a snapshot nothing else references while writing to the service
+            expected = model.state()
+            seen = []
+            for task in service.snapshot():
+                seen.append(task_state(task))
+                roll = rng.random()
+                if roll < 0.3:
+                    assert service.delete_task(task.id) == model.delete(task.id), context
+                elif roll < 0.6:
+                    completed = rng.random() < 0.5
+                    if completed:
+                        actual = service.mark_task_complete(task.id)
+                    else:
+                        actual = service.mark_task_incomplete(task.id)
+                    assert actual == model.set_completed(task.id, completed), context
+                elif roll < 0.7:
+                    title = _random_title(rng)
+                    expected_update = _call(model.update, task.id, title, None)
+                    actual_update = _call(service.update_task, task.id, title, None)
+                    if actual_update[0] == "ok":
+                        actual_update = ("ok", task_state(actual_update[1]))
+                    assert actual_update == expected_update, context
+            assert seen == expected, f"{context} temporary snapshot diverged"
+        else:
+            assert [task_state(t) for t in service.get_all_tasks()] == model.state(), context
+
+        if check_every and step % check_every == 0:
+            assert [task_state(t) for t in service.get_all_tasks()] == model.state(), context
+
+    assert [task_state(t) for t in service.get_all_tasks()] == model.state()
+    check_snapshots(snapshots)
+    return model
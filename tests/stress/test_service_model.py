@@ -0,0 +1,96 @@
+import gc
+import os
+import time
+import tracemalloc
+import pytest
+from tests.stress.harness import IMPLEMENTATIONS, run_workload
+
+
+# Scale runs are slow; enable them with TODO_STRESS=1
+STRESS = os.environ.get("TODO_STRESS") == "1"
+requires_stress = pytest.mark.skipif(not STRESS, reason="set TODO_STRESS=1 to run scale tests")
+
+implementations = pytest.mark.parametrize(
+    "factory", list(IMPLEMENTATIONS.values()), ids=list(IMPLEMENTATIONS)
+)
+
+
+@implementations
+@pytest.mark.parametrize("seed", range(20))
+def test_random_workload_matches_model(factory, seed):
+    """Test that random operation sequences match the reference model."""
+    run_workload(factory(), steps=400, seed=seed)
+
+
+@implementations
+def test_delete_heavy_workload_matches_model(factory):
+    """Test a workload dominated by deletes and lookups of missing tasks."""
+    weights = {"add": 10, "delete": 20, "get": 10, "complete": 5, "list": 2}
+    run_workload(factory(), steps=2000, seed=1234, weights=weights)
+
+
+@implementations
+def test_update_heavy_workload_matches_model(factory):
+    """Test a workload dominated by updates and status changes."""
+    weights = {"add": 5, "update": 30, "complete": 10, "incomplete": 10, "list": 1}
+    run_workload(factory(), steps=2000, seed=4321, weights=weights)
+
+
+@implementations
+@pytest.mark.parametrize("seed", range(5))
+def test_recurring_heavy_workload_matches_model(factory, seed):
+    """Test a workload dominated by recurring tasks and occurrence changes."""
+    weights = {
+        "recurring": 15, "add": 5, "update": 20, "complete": 20, "incomplete": 10,
+        "delete": 10, "get": 15, "occurrences": 5, "snapshot": 2,
+    }
+    run_workload(factory(), steps=1500, seed=seed, weights=weights)
+
+
+@requires_stress
+@implementations
+def test_large_workload_matches_model(factory):
+    """Test a long workload at scale, checking the full state periodically."""
+    run_workload(factory(), steps=50_000, seed=7, check_every=5_000)
+
+
+@requires_stress
+@implementations
+def test_no_performance_cliff(factory):
+    """Test that doubling the workload does not blow up the run time."""
+    weights = {"add": 40, "get": 30, "update": 10, "complete": 10, "delete": 10}
+
+    def elapsed(steps):
+        # Best of three runs, so a single scheduling hiccup does not decide the result
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            run_workload(factory(), steps=steps, seed=99, weights=weights, check_every=0)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    small, large = elapsed(5_000), elapsed(10_000)
+    # The list backend is O(n) per lookup, so doubling costs at most about 4x
+    assert large < small * 5, f"5k steps: {small:.3f}s, 10k steps: {large:.3f}s"
+
+
+@requires_stress
+@implementations
+def test_no_memory_leak_after_deleting_everything(factory):
+    """Test that memory returns to baseline once every task is deleted."""
+    tracemalloc.start()
+    try:
+        service = factory()
+        gc.collect()
+        baseline = tracemalloc.get_traced_memory()[0]
+
+        for _ in range(3):
+            run_workload(service, steps=10_000, seed=5, check_every=0)
+            for task in service.get_all_tasks():
+                service.delete_task(task.id)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+    assert retained < 256 * 1024, f"{retained} bytes retained after deleting all tasks"
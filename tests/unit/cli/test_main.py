@@ -0,0 +1,93 @@
+import io
+import pytest
+from src.cli import main as cli
+from src.cli.render import Renderer
+from src.services.todo_service import TodoService
+
+
+class _Recorder(io.StringIO):
+    """StringIO that records each write call."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(text)
+        return super().write(text)
+
+
+@pytest.fixture
+def stream(monkeypatch):
+    """Route the CLI renderer to a recording stream."""
+    recorder = _Recorder()
+    monkeypatch.setattr(cli, "renderer", Renderer(stream=recorder))
+    return recorder
+
+
+def _answer(monkeypatch, *answers):
+    """Feed the given answers to input() in order."""
+    replies = iter(answers)
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(replies))
+
+
+def test_add_task_writes_one_screen(monkeypatch, stream):
+    """Test that the add handler writes its messages in a single call."""
+    _answer(monkeypatch, "Buy milk", "")
+
+    cli.handle_add_task(TodoService())
+
+    assert len(stream.writes) == 1
+    assert "Task 'Buy milk' added successfully!" in stream.writes[0]
+    assert "Task ID: " in stream.writes[0]
+
+
+def test_update_task_without_changes(monkeypatch, stream):
+    """Test that the update handler renders the current task and the no-change notice."""
+    service = TodoService()
+    task = service.add_task("Buy milk", "Two litres")
+    _answer(monkeypatch, task.id, "", "")
+
+    cli.handle_update_task(service)
+
+    assert stream.writes == [
+        "Current task: Buy milk\nCurrent description: Two litres\n",
+        "No changes made to the task.\n",
+    ]
+
+
+def test_complete_task_writes_one_screen(monkeypatch, stream):
+    """Test that the complete handler writes its messages in a single call."""
+    service = TodoService()
+    task = service.add_task("Buy milk")
+    _answer(monkeypatch, task.id)
+
+    cli.handle_complete_task(service)
+
+    assert stream.writes == ["Task marked as complete!\nTask: Buy milk\n"]
+
+
+def test_delete_missing_task_reports_error(monkeypatch, stream):
+    """Test that errors go through the renderer without color on a pipe."""
+    _answer(monkeypatch, "missing")
+
+    cli.handle_delete_task(TodoService())
+
+    assert stream.writes == ["Task with ID missing not found.\n"]
+
+
+@pytest.mark.parametrize("value", ["0", "-5", "many"])
+def test_profile_tasks_must_be_positive(value, capsys):
+    """Test that a non-positive --profile-tasks is a usage error."""
+    with pytest.raises(SystemExit) as excinfo:
+        cli.parse_args(["--profile-memory", "--profile-tasks", value])
+
+    assert excinfo.value.code == 2
+    assert "--profile-tasks" in capsys.readouterr().err
+
+
+def test_profile_tasks_accepts_positive_int():
+    """Test that a positive --profile-tasks is parsed as an int."""
+    args = cli.parse_args(["--profile-memory", "--profile-tasks", "25"])
+
+    assert args.profile_tasks == 25
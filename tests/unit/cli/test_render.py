@@ -0,0 +1,141 @@
+import io
+import json
+import pytest
+from datetime import datetime
+from src.cli.render import Renderer, stream_supports_color
+from src.models.recurrence import RecurrenceRule
+from src.models.task import Task
+
+
+class _TTY(io.StringIO):
+    """StringIO that claims to be a terminal."""
+
+    def isatty(self):
+        return True
+
+
+def _make_tasks():
+    return [
+        Task(id="1", title="First", description="Details", completed=True),
+        Task(id="2", title="Second"),
+    ]
+
+
+def test_non_tty_output_has_no_color_codes():
+    """Test that messages written to a pipe-like stream drop ANSI codes."""
+    stream = io.StringIO()
+    renderer = Renderer(stream=stream)
+    renderer.success("Saved")
+    renderer.error("Failed")
+    renderer.flush()
+
+    assert stream.getvalue() == "Saved\nFailed\n"
+    assert stream_supports_color(stream) is False
+
+
+def test_tty_output_keeps_color_codes():
+    """Test that messages written to a terminal are colored."""
+    stream = _TTY()
+    renderer = Renderer(stream=stream)
+    renderer.success("Saved")
+    renderer.flush()
+
+    assert stream.getvalue() == "\033[92mSaved\033[0m\n"
+
+
+def test_color_can_be_forced_off():
+    """Test that color=False disables colors on a terminal."""
+    stream = _TTY()
+    renderer = Renderer(color=False, stream=stream)
+    renderer.error("Failed")
+    renderer.flush()
+
+    assert stream.getvalue() == "Failed\n"
+
+
+def test_table_format_matches_legacy_layout():
+    """Test that the table format keeps the original task list layout."""
+    stream = io.StringIO()
+    renderer = Renderer(stream=stream)
+    renderer.tasks(_make_tasks())
+    renderer.flush()
+
+    assert stream.getvalue() == (
+        "\nAll Tasks:\n"
+        + "-" * 50 + "\n"
+        "[X] ID: 1\n"
+        "    Title: First\n"
+        "    Description: Details\n"
+        "\n"
+        "[O] ID: 2\n"
+        "    Title: Second\n"
+        "\n"
+    )
+
+
+def test_table_format_empty_list():
+    """Test that an empty list renders the 'No tasks found' message."""
+    stream = io.StringIO()
+    renderer = Renderer(stream=stream)
+    renderer.tasks([])
+    renderer.flush()
+
+    assert stream.getvalue() == "\nNo tasks found.\n"
+
+
+def test_compact_format_one_line_per_task():
+    """Test that the compact format renders one line per task."""
+    stream = io.StringIO()
+    renderer = Renderer(fmt="compact", stream=stream)
+    renderer.tasks(iter(_make_tasks()))
+    renderer.flush()
+
+    assert stream.getvalue() == "[X] 1  First\n[O] 2  Second\n"
+
+
+def test_json_format_is_parseable():
+    """Test that the JSON format round-trips the task fields."""
+    stream = io.StringIO()
+    renderer = Renderer(fmt="json", stream=stream)
+    renderer.tasks(_make_tasks())
+    renderer.flush()
+
+    data = json.loads(stream.getvalue())
+    assert data == [
+        {"id": "1", "title": "First", "description": "Details", "completed": True},
+        {"id": "2", "title": "Second", "description": None, "completed": False},
+    ]
+
+
+def test_flush_writes_once():
+    """Test that a whole screen is written with a single write call."""
+    writes = []
+
+    class _Recorder(io.StringIO):
+        def write(self, text):
+            writes.append(text)
+            return super().write(text)
+
+    renderer = Renderer(stream=_Recorder())
+    renderer.menu()
+    renderer.tasks(_make_tasks())
+    renderer.flush()
+
+    assert len(writes) == 1
+
+
+def test_unsupported_format_raises_error():
+    """Test that an unknown output format raises ValueError."""
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        Renderer(fmt="xml")
+
+
+def test_table_format_shows_recurrence():
+    """Test that recurring tasks show their rule in the table format."""
+    stream = io.StringIO()
+    renderer = Renderer(stream=stream)
+    rule = RecurrenceRule("weekly", datetime(2026, 1, 5, 9, 0))
+    renderer.tasks([Task(id="1", title="Standup", recurrence=rule)])
+    renderer.flush()
+
+    assert "    Repeats: weekly from 2026-01-05 09:00\n" in stream.getvalue()
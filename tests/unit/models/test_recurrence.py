@@ -0,0 +1,119 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from src.models.recurrence import RecurrenceRule
+
+
+START = datetime(2026, 1, 5, 9, 0)  # A Monday
+
+
+def test_daily_occurrences_in_window():
+    """Test that a daily rule yields one occurrence per day in the window."""
+    rule = RecurrenceRule("daily", START)
+    occurrences = list(rule.between(datetime(2026, 1, 10), datetime(2026, 1, 13)))
+
+    assert occurrences == [
+        datetime(2026, 1, 10, 9, 0),
+        datetime(2026, 1, 11, 9, 0),
+        datetime(2026, 1, 12, 9, 0),
+    ]
+
+
+def test_daily_interval():
+    """Test that the interval skips periods."""
+    rule = RecurrenceRule("daily", START, interval=3)
+
+    assert list(islice(rule.between(START), 3)) == [
+        START, START + timedelta(days=3), START + timedelta(days=6)
+    ]
+
+
+def test_weekly_on_weekdays():
+    """Test a weekly rule repeating on several weekdays."""
+    rule = RecurrenceRule("weekly", START, weekdays=(4, 0, 2))
+
+    assert list(islice(rule.between(START), 4)) == [
+        datetime(2026, 1, 5, 9, 0),
+        datetime(2026, 1, 7, 9, 0),
+        datetime(2026, 1, 9, 9, 0),
+        datetime(2026, 1, 12, 9, 0),
+    ]
+
+
+def test_weekly_skips_weekdays_before_start():
+    """Test that slots earlier in the first week than the start are skipped."""
+    rule = RecurrenceRule("weekly", START + timedelta(days=2), weekdays=(0, 3), count=3)
+
+    assert list(rule.between(START)) == [
+        datetime(2026, 1, 8, 9, 0),
+        datetime(2026, 1, 12, 9, 0),
+        datetime(2026, 1, 15, 9, 0),
+    ]
+
+
+def test_count_is_respected_from_a_late_window():
+    """Test that count limits apply even when the window starts mid-series."""
+    rule = RecurrenceRule("daily", START, count=10)
+
+    assert list(rule.between(START + timedelta(days=8))) == [
+        START + timedelta(days=8), START + timedelta(days=9)
+    ]
+
+
+def test_until_is_inclusive():
+    """Test that an occurrence exactly at until is included."""
+    rule = RecurrenceRule("daily", START, until=START + timedelta(days=2))
+
+    assert len(list(rule.between(START))) == 3
+
+
+def test_far_window_is_generated_lazily():
+    """Test that a window far in the future does not walk earlier occurrences."""
+    rule = RecurrenceRule("daily", START)
+    far = START + timedelta(days=1_000_000)
+
+    assert next(rule.between(far)) == far
+
+
+def test_occurs_at():
+    """Test matching an exact occurrence time."""
+    rule = RecurrenceRule("weekly", START, weekdays=(0, 2))
+
+    assert rule.occurs_at(datetime(2026, 1, 14, 9, 0))
+    assert not rule.occurs_at(datetime(2026, 1, 13, 9, 0))
+    assert not rule.occurs_at(datetime(2026, 1, 14, 10, 0))
+    assert not rule.occurs_at(START - timedelta(days=7))
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    ({"frequency": "hourly"}, "Unsupported recurrence frequency"),
+    ({"frequency": "daily", "interval": 0}, "interval must be at least 1"),
+    ({"frequency": "daily", "count": 0}, "count must be at least 1"),
+    ({"frequency": "daily", "weekdays": (1,)}, "only supported for weekly"),
+    ({"frequency": "weekly", "weekdays": (7,)}, "Weekdays must be integers"),
+])
+def test_invalid_rules_raise_error(kwargs, message):
+    """Test that invalid rules raise ValueError."""
+    with pytest.raises(ValueError, match=message):
+        RecurrenceRule(start=START, **kwargs)
+
+
+def test_start_and_until_truncated_to_seconds():
+    """Test that sub-second precision is dropped so occurrences stay addressable."""
+    rule = RecurrenceRule(
+        "daily", START.replace(microsecond=500), until=START.replace(microsecond=999)
+    )
+
+    assert rule.start == START
+    assert rule.until == START
+    assert list(rule.between(START)) == [START]
+
+
+@pytest.mark.parametrize("field", ["start", "until"])
+def test_timezone_aware_datetimes_raise_error(field):
+    """Test that aware datetimes are rejected."""
+    aware = START.replace(tzinfo=timezone.utc)
+    kwargs = {"start": START, field: aware}
+
+    with pytest.raises(ValueError, match=f"Recurrence {field} must be a naive datetime"):
+        RecurrenceRule("daily", **kwargs)
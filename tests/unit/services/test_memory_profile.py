@@ -0,0 +1,89 @@
+import dis
+import pytest
+import tracemalloc
+from src.services.memory_profile import format_report, profile_workload
+from src.services.todo_service import TodoService
+
+
+def test_profile_workload_reports_every_method():
+    """Test that the workload reports one phase per service method."""
+    report = profile_workload(tasks=200)
+
+    assert [phase.method for phase in report.phases] == [
+        "add_task", "get_all_tasks", "get_task_by_id", "update_task",
+        "mark_task_complete", "mark_task_incomplete", "delete_task",
+    ]
+    assert report.phases[0].calls == 200
+    assert report.tasks == 200
+
+
+def test_profile_workload_measures_task_cost():
+    """Test that adding tasks retains a positive number of bytes per task."""
+    report = profile_workload(tasks=500)
+
+    assert report.bytes_per_task > 0
+    assert report.phases[0].size_diff > 0
+    assert report.phases[-1].size_diff < 0
+    assert any("task.py" in site.location for site in report.phases[0].top_sites)
+
+
+def test_profile_workload_reports_service_and_model_sites():
+    """Test that sites are service or model lines, not the profiler or its workload driver."""
+    report = profile_workload(tasks=200)
+
+    for phase in report.phases:
+        for site in phase.top_sites:
+            assert "tracemalloc" not in site.location
+            assert "memory_profile.py" not in site.location
+            assert "uuid.py" not in site.location
+
+
+def test_profile_workload_uses_service_factory():
+    """Test that a custom service factory is profiled."""
+    created = []
+
+    def factory():
+        service = TodoService()
+        created.append(service)
+        return service
+
+    profile_workload(tasks=50, service_factory=factory)
+
+    assert len(created) == 1
+    assert len(created[0].get_all_tasks()) == 0
+
+
+def test_profile_workload_restores_tracing_state():
+    """Test that tracing is stopped again unless it was already running."""
+    profile_workload(tasks=10)
+
+    assert not tracemalloc.is_tracing()
+
+
+def test_profile_workload_requires_tasks():
+    """Test that an empty workload raises ValueError."""
+    with pytest.raises(ValueError, match="at least one task"):
+        profile_workload(tasks=0)
+
+
+def test_format_report():
+    """Test that the formatted report includes the summary and method table."""
+    lines = format_report(profile_workload(tasks=20))
+
+    assert lines[0] == "Memory profile: 20 tasks"
+    assert lines[1].startswith("Bytes per task: ")
+    assert any(line.startswith("delete_task") for line in lines)
+    assert "Top allocation sites: add_task" in lines
+
+
+def test_profile_workload_skips_service_lock_wrapper():
+    """Test that no site points at the lock wrapper around the service's write methods."""
+    wrapper = TodoService.update_task.__code__
+    wrapper_sites = {
+        f"{wrapper.co_filename}:{lineno}" for _, lineno in dis.findlinestarts(wrapper)
+    }
+    report = profile_workload(tasks=2000, top=50)
+
+    for phase in report.phases:
+        for site in phase.top_sites:
+            assert site.location not in wrapper_sites, f"{phase.method}: {site.location}"
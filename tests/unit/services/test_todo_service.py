@@ -1,4 +1,7 @@
 import pytest
+import threading
+from datetime import datetime, timedelta, timezone
+from src.models.recurrence import RecurrenceRule
 from src.services.todo_service import TodoService
 from src.models.task import Task
 
@@ -151,4 +154,308 @@ class TestTodoService:
         """Test that marking a non-existent task as incomplete returns False."""
         success = self.service.mark_task_incomplete("nonexistent-id")
         
-        assert success is False
\ No newline at end of file
+        assert success is False
+
+
+class TestRecurringTasks:
+    """Tests for recurring tasks in the TodoService class."""
+    
+    def setup_method(self):
+        """Set up a service with one daily recurring task."""
+        self.service = TodoService()
+        self.start = datetime(2026, 1, 5, 9, 0)
+        self.task = self.service.add_task(
+            "Standup", recurrence=RecurrenceRule("daily", self.start)
+        )
+    
+    def occurrences(self, days=3):
+        """Return the occurrences of the first few days."""
+        return list(self.service.get_occurrences(
+            self.start, self.start + timedelta(days=days)
+        ))
+    
+    def test_recurring_task_is_stored_once(self):
+        """Test that adding a recurring task stores only the rule."""
+        assert self.service.get_all_tasks() == [self.task]
+        assert self.task.recurrence.frequency == "daily"
+    
+    def test_get_occurrences_generates_window(self):
+        """Test that occurrences are generated for the requested window."""
+        occurrences = self.occurrences()
+        
+        assert [o.due for o in occurrences] == [
+            self.start + timedelta(days=i) for i in range(3)
+        ]
+        assert all(o.title == "Standup" and not o.completed for o in occurrences)
+        assert occurrences[0].id == f"{self.task.id}@20260105T090000"
+    
+    def test_get_occurrences_merges_tasks_in_time_order(self):
+        """Test that occurrences of several rules are merged chronologically."""
+        self.service.add_task(
+            "Review", recurrence=RecurrenceRule("daily", self.start - timedelta(hours=1))
+        )
+        
+        titles = [o.title for o in self.occurrences(days=2)]
+        
+        assert titles == ["Standup", "Review", "Standup", "Review"]
+    
+    def test_complete_occurrence_stores_exception(self):
+        """Test that completing an occurrence affects only that occurrence."""
+        occurrence_id = self.occurrences()[1].id
+        
+        assert self.service.mark_task_complete(occurrence_id) is True
+        
+        assert [o.completed for o in self.occurrences()] == [False, True, False]
+        assert self.service.get_task_by_id(occurrence_id).completed is True
+        assert self.task.completed is False
+        assert len(self.service.get_all_tasks()) == 1
+    
+    def test_incomplete_occurrence_drops_exception(self):
+        """Test that reverting an occurrence removes the stored exception."""
+        occurrence_id = self.occurrences()[1].id
+        self.service.mark_task_complete(occurrence_id)
+        
+        assert self.service.mark_task_incomplete(occurrence_id) is True
+        
+        assert self.service._exceptions == {}
+    
+    def test_changed_occurrence_stores_only_changed_fields(self):
+        """Test that an occurrence exception holds only the fields that differ."""
+        occurrence = self.occurrences()[1]
+        self.service.mark_task_complete(occurrence.id)
+    
+        assert self.service._exceptions == {self.task.id: {occurrence.due: {"completed": True}}}
+    
+    def test_changed_occurrence_follows_task_updates(self):
+        """Test that updating the recurring task reaches occurrences changed before."""
+        occurrence_id = self.occurrences()[1].id
+        self.service.mark_task_complete(occurrence_id)
+        self.service.update_task(self.task.id, title="Renamed")
+    
+        assert self.service.get_task_by_id(occurrence_id).title == "Renamed"
+        assert self.service.mark_task_incomplete(occurrence_id) is True
+    
+        assert [o.title for o in self.occurrences()] == ["Renamed"] * 3
+        assert self.service._exceptions == {}
+    
+    def test_update_occurrence(self):
+        """Test that updating an occurrence changes only that occurrence."""
+        occurrence_id = self.occurrences()[0].id
+        
+        updated = self.service.update_task(occurrence_id, title="  Retro  ")
+        
+        assert updated.title == "Retro"
+        assert [o.title for o in self.occurrences()] == ["Retro", "Standup", "Standup"]
+    
+    def test_update_occurrence_empty_title_raises_error(self):
+        """Test that updating an occurrence with an empty title raises ValueError."""
+        occurrence_id = self.occurrences()[0].id
+        
+        with pytest.raises(ValueError, match="Task title cannot be empty"):
+            self.service.update_task(occurrence_id, title="   ")
+    
+    def test_delete_occurrence(self):
+        """Test that deleting an occurrence skips it in later listings."""
+        occurrence_id = self.occurrences()[1].id
+        
+        assert self.service.delete_task(occurrence_id) is True
+        assert self.service.delete_task(occurrence_id) is False
+        
+        assert len(self.occurrences()) == 2
+        assert self.service.get_task_by_id(occurrence_id) is None
+        assert self.service.mark_task_complete(occurrence_id) is False
+    
+    def test_delete_recurring_task_removes_exceptions(self):
+        """Test that deleting the recurring task drops its occurrences."""
+        self.service.mark_task_complete(self.occurrences()[0].id)
+        
+        assert self.service.delete_task(self.task.id) is True
+        
+        assert self.occurrences() == []
+        assert self.service._exceptions == {}
+    
+    def test_invalid_occurrence_ids_not_found(self):
+        """Test that occurrence IDs not matching the rule are not found."""
+        assert self.service.get_task_by_id(f"{self.task.id}@20260105T100000") is None
+        assert self.service.get_task_by_id(f"{self.task.id}@not-a-date") is None
+        assert self.service.get_task_by_id("unknown@20260105T090000") is None
+        assert self.service.mark_task_complete(f"{self.task.id}@20260104T090000") is False
+    
+    def test_non_canonical_occurrence_ids_not_found(self):
+        """Test that occurrence IDs must use the exact zero-padded timestamp."""
+        for stamp in ("2026015T090000", "20260105T90000", "20260105T0900000"):
+            occurrence_id = f"{self.task.id}@{stamp}"
+            
+            assert self.service.get_task_by_id(occurrence_id) is None
+            assert self.service.update_task(occurrence_id, title="Renamed") is None
+            assert self.service.mark_task_complete(occurrence_id) is False
+            assert self.service.delete_task(occurrence_id) is False
+        assert self.service._exceptions == {}
+    
+    def test_sub_second_start_occurrences_are_addressable(self):
+        """Test that a rule started with microseconds yields usable occurrence IDs."""
+        task = self.service.add_task(
+            "Precise", recurrence=RecurrenceRule("daily", self.start.replace(microsecond=500))
+        )
+        occurrence_id = f"{task.id}@20260105T090000"
+        
+        assert self.service.get_task_by_id(occurrence_id).title == "Precise"
+        assert self.service.mark_task_complete(occurrence_id) is True
+        assert self.service.get_task_by_id(occurrence_id).completed is True
+    
+    def test_timezone_aware_recurrence_rejected(self):
+        """Test that recurring tasks cannot be created with an aware start."""
+        rule_start = self.start.replace(tzinfo=timezone.utc)
+        
+        with pytest.raises(ValueError, match="naive datetime"):
+            self.service.add_task("Aware", recurrence=RecurrenceRule("daily", rule_start))
+
+
+class TestSnapshots:
+    """Tests for TodoService snapshots."""
+    
+    def setup_method(self):
+        """Set up a service with two tasks."""
+        self.service = TodoService()
+        self.task1 = self.service.add_task("Task 1", "First")
+        self.task2 = self.service.add_task("Task 2")
+    
+    def test_snapshot_lists_current_tasks(self):
+        """Test that a snapshot contains the tasks at the time it was taken."""
+        snapshot = self.service.snapshot()
+        
+        assert len(snapshot) == 2
+        assert list(snapshot) == [self.task1, self.task2]
+        assert snapshot.get_task_by_id(self.task1.id) is self.task1
+    
+    def test_snapshot_shares_storage_until_write(self):
+        """Test that taking a snapshot does not copy the task list."""
+        snapshot = self.service.snapshot()
+        
+        assert snapshot._tasks is self.service._tasks
+    
+    def test_snapshot_is_isolated_from_writes(self):
+        """Test that later adds, updates, status changes and deletes are not visible."""
+        snapshot = self.service.snapshot()
+        
+        self.service.add_task("Task 3")
+        self.service.update_task(self.task1.id, title="Changed")
+        self.service.mark_task_complete(self.task2.id)
+        self.service.delete_task(self.task1.id)
+        
+        assert [(t.title, t.completed) for t in snapshot] == [
+            ("Task 1", False), ("Task 2", False)
+        ]
+        assert snapshot.get_task_by_id(self.task1.id).title == "Task 1"
+        assert [(t.title, t.completed) for t in self.service.get_all_tasks()] == [
+            ("Task 2", True), ("Task 3", False)
+        ]
+    
+    def test_writes_copy_each_task_once_per_snapshot(self):
+        """Test that repeated writes after a snapshot reuse the copied task."""
+        snapshot = self.service.snapshot()
+        
+        first = self.service.update_task(self.task1.id, title="Once")
+        second = self.service.update_task(self.task1.id, description="Twice")
+        
+        assert first is second
+        assert first is not self.task1
+        assert snapshot.get_task_by_id(self.task1.id) is self.task1
+    
+    def test_churn_after_one_snapshot_does_not_grow_bookkeeping(self):
+        """Test that add/delete churn after a single snapshot leaves nothing behind."""
+        rule = RecurrenceRule("daily", datetime(2026, 1, 5, 9, 0))
+        self.service.snapshot()
+    
+        for _ in range(1000):
+            task = self.service.add_task("Churn", recurrence=rule)
+            self.service.mark_task_complete(f"{task.id}@20260105T090000")
+            self.service.mark_task_complete(task.id)
+            self.service.delete_task(task.id)
+    
+        assert len(self.service.get_all_tasks()) == 2
+        assert self.service._owned_tasks == set()
+        assert self.service._owned_exceptions == set()
+        assert self.service._exceptions == {}
+    
+    def test_writes_in_place_before_any_snapshot(self):
+        """Test that tasks are modified in place until a snapshot is taken."""
+        self.service.mark_task_complete(self.task1.id)
+        
+        assert self.task1.completed is True
+    
+    def test_tasks_read_before_snapshot_do_not_see_later_writes(self):
+        """Test that a write after a snapshot replaces the task returned earlier."""
+        self.service.snapshot()
+        
+        assert self.service.mark_task_complete(self.task1.id) is True
+        
+        assert self.task1.completed is False
+        assert self.service.get_task_by_id(self.task1.id).completed is True
+    
+    def test_released_snapshot_results_stay_isolated(self):
+        """Test that tasks read from a discarded snapshot are not modified later."""
+        tasks = self.service.snapshot().get_all_tasks()
+        
+        self.service.mark_task_complete(self.task1.id)
+        
+        assert [t.completed for t in tasks] == [False, False]
+    
+    def test_iterating_temporary_snapshot_while_deleting(self):
+        """Test that deleting while iterating an unreferenced snapshot sees every task."""
+        for i in range(4):
+            self.service.add_task(f"Extra {i}")
+        
+        seen = []
+        for task in self.service.snapshot():
+            seen.append(task.title)
+            self.service.delete_task(task.id)
+        
+        assert len(seen) == 6
+        assert self.service.get_all_tasks() == []
+    
+    def test_concurrent_writers_and_snapshots(self):
+        """Test that snapshots taken while other threads write are internally consistent."""
+        def writer():
+            for i in range(500):
+                task = self.service.add_task(f"Thread task {i}")
+                self.service.mark_task_complete(task.id)
+                self.service.delete_task(task.id)
+        
+        threads = [threading.Thread(target=writer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for _ in range(200):
+            snapshot = self.service.snapshot()
+            tasks = list(snapshot)
+            assert len(tasks) == len(snapshot)
+            assert len({task.id for task in tasks}) == len(tasks)
+        for thread in threads:
+            thread.join()
+        
+        assert [t.id for t in self.service.get_all_tasks()] == [self.task1.id, self.task2.id]
+    
+    def test_snapshots_are_independent(self):
+        """Test that each snapshot keeps its own point in time."""
+        first = self.service.snapshot()
+        self.service.mark_task_complete(self.task1.id)
+        second = self.service.snapshot()
+        self.service.mark_task_incomplete(self.task1.id)
+        
+        assert first.get_task_by_id(self.task1.id).completed is False
+        assert second.get_task_by_id(self.task1.id).completed is True
+        assert self.service.get_task_by_id(self.task1.id).completed is False
+    
+    def test_snapshot_is_isolated_from_occurrence_changes(self):
+        """Test that occurrence exceptions recorded later are not visible."""
+        start = datetime(2026, 1, 5, 9, 0)
+        task = self.service.add_task("Standup", recurrence=RecurrenceRule("daily", start))
+        occurrence_id = next(self.service.get_occurrences(start)).id
+        snapshot = self.service.snapshot()
+        
+        self.service.mark_task_complete(occurrence_id)
+        self.service.delete_task(f"{task.id}@20260106T090000")
+        
+        window = (start, start + timedelta(days=2))
+        assert [o.completed for o in snapshot.get_occurrences(*window)] == [False, False]
+        assert [o.completed for o in self.service.get_occurrences(*window)] == [True]